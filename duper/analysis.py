@@ -3,18 +3,95 @@ Module containing the helper functions for fitting the duper to data.
 """
 from __future__ import annotations
 
-from typing import Type
+from typing import Dict, Type
 
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
 
-from . import generator
-from .generator.base import Generator
+from . import generator, helper
+from .generator.base import Generator, SeedLike
+
+_KIND_TO_GENERATOR: Dict[str, Type[Generator]] = {
+    "f": generator.Numeric,
+    "i": generator.Numeric,
+    "u": generator.Numeric,
+    "M": generator.Datetime,
+}
+"""Generator classes by numpy dtype kind, used if data is not categorical."""
+
+_SAMPLE_THRESHOLD = 100_000
+"""Data size above which the category check runs on a sample first."""
+
+_SAMPLE_SIZE = 10_000
+"""Size of the random sample for the category check of large data."""
+
+
+def _unique_values(data: NDArray) -> NDArray:
+    """Returns the unique values of the data, excluding NA. Integer and boolean
+    data cannot hold NA, so the NA check is skipped for those.
+
+    Args:
+        data (NDArray): 1-dimensional array of values.
+
+    Returns:
+        NDArray: unique values in order of appearance, excluding NA.
+    """
+    unique_values = pd.unique(data)
+    if data.dtype.kind in "iub":
+        return unique_values
+    return unique_values[~helper.isna(unique_values)]
+
+
+def _all_same_length(values: NDArray) -> bool:
+    """Checks if all values have the same length. Lengths of numpy strings are
+    computed vectorized, other values are compared until the first value that
+    differs in length from the first one.
+
+    Args:
+        values (NDArray): 1-dimensional array of sized values, e.g. strings.
+
+    Returns:
+        bool: True if all values have the same length, also if empty.
+    """
+    if values.size == 0:
+        return True
+    if values.dtype.kind in "SU":
+        # numpy strings are padded to a fixed width, but str_len ignores it
+        str_lengths = np.char.str_len(values)
+        return bool(str_lengths.min() == str_lengths.max())
+    lengths = map(len, values)
+    first = next(lengths, None)
+    return all(length == first for length in lengths)
+
+
+def _is_clearly_categorical(
+    data: NDArray, category_threshold: float, seed: SeedLike = None
+) -> bool:
+    """Checks on a random sample of large data if the fraction of unique values
+    is well below the category threshold. The fraction of unique values does
+    not grow with the sample size, so a low fraction carries over to the data.
+
+    Args:
+        data (NDArray): 1-dimensional array of values.
+        category_threshold (float): fraction of unique values
+                until which category duper is perferred, should be in [0,1].
+        seed (SeedLike, optional): seed of the random sample. Defaults to None.
+
+    Returns:
+        bool: True if the data is large and clearly categorical. False if the
+            data is small or the sample is not conclusive.
+    """
+    if len(data) <= _SAMPLE_THRESHOLD:
+        return False
+    rng = np.random.default_rng(seed)
+    sample = data[rng.integers(len(data), size=_SAMPLE_SIZE)]
+    n_unique = len(_unique_values(sample))
+    return 1 < n_unique and n_unique / _SAMPLE_SIZE < 0.5 * category_threshold
 
 
 def find_best_generator(
-    data: NDArray, category_threshold: float
+    data: NDArray, category_threshold: float, seed: SeedLike = None
 ) -> Type[Generator]:
     """Tries to find the best generator class to replicate the provided data.
 
@@ -23,34 +100,37 @@ def find_best_generator(
         category_threshold (float): fraction of unique values
                 until which category duper is perferred, should be in [0,1].
                 Defaults to 0.05.
+        seed (SeedLike, optional): seed of the random sample drawn to check
+                large data for categories. Defaults to None.
 
     Returns:
         Type[Generator]: the best generator class to replicate the provided data
     """
     data = Generator.validate(data=data)
+    kind = data.dtype.kind
 
-    unique_values = pd.unique(data)
-    unique_values = unique_values[~pd.isna(unique_values)]
+    if kind == "b":
+        # boolean data cannot hold more than two values
+        if data.any() and not data.all():
+            return generator.Category
+        return generator.Constant
+
+    if _is_clearly_categorical(data, category_threshold, seed=seed):
+        return generator.Category
+
+    unique_values = _unique_values(data)
 
     if len(unique_values) <= 1:
         return generator.Constant
 
-    if (
-        data.dtype == np.bool_
-        or len(unique_values) / len(data) < category_threshold
-    ):
+    if len(unique_values) / len(data) < category_threshold:
         return generator.Category
 
-    if np.issubdtype(data.dtype, np.float_) or np.issubdtype(
-        data.dtype, np.int_
-    ):
-        return generator.Numeric
-
-    if np.issubdtype(data.dtype, np.datetime64):
-        return generator.Datetime
+    if kind in _KIND_TO_GENERATOR:
+        return _KIND_TO_GENERATOR[kind]
 
-    if data.dtype == np.str_ or data.dtype == np.object_:
-        if len(set(map(len, unique_values))) == 1:
+    if kind in "OU":
+        if _all_same_length(unique_values):
             return generator.Regex
 
     return generator.Category
@@ -3,13 +3,55 @@ The core module of data-duper.
 """
 from __future__ import annotations
 
-from typing import Dict, Hashable, List
-
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
 import pandas as pd
-from numpy.typing import DTypeLike
+from numpy.typing import DTypeLike, NDArray
 
 from . import analysis
-from .generator.base import Generator
+from .generator import base as generator_base
+from .generator.base import Generator, SeedLike
+
+_CACHE_SIZE = 256
+"""Number of columns whose generator class is cached by :meth:`Duper.fit()`."""
+
+
+def _executor(n_tasks: int) -> ThreadPoolExecutor:
+    """Creates a thread pool to process independent columns in parallel. The
+    heavy lifting is done in numpy and pandas, which release the GIL.
+
+    Args:
+        n_tasks (int): number of tasks to process, e.g. number of columns.
+
+    Returns:
+        ThreadPoolExecutor: executor with at most one worker per CPU.
+    """
+    return ThreadPoolExecutor(
+        max_workers=max(1, min(n_tasks, os.cpu_count() or 1))
+    )
+
+
+def _signature(data: NDArray, category_threshold: float) -> Optional[Hashable]:
+    """Derives a key from the full content of a column, under which the choice
+    of the generator class can be cached. Object data is not hashed.
+
+    Args:
+        data (NDArray): 1-dimensional array of values.
+        category_threshold (float): category threshold of the fit.
+
+    Returns:
+        Optional[Hashable]: key of the data, None for object data.
+    """
+    if data.dtype.kind == "O":
+        return None
+    digest = hashlib.blake2b(np.ascontiguousarray(data).view(np.uint8).data)
+    return (data.dtype.str, data.size, category_threshold, digest.hexdigest())
 
 
 class Duper:
@@ -30,9 +72,20 @@ class Duper:
         >>> print(df_dupe)
     """
 
-    def __init__(self):
-        """Creates a new empty duper instance."""
+    def __init__(self, seed: SeedLike = None):
+        """Creates a new empty duper instance.
+
+        Args:
+            seed (SeedLike, optional): seed of the random number generator,
+                from which the generators of the columns are seeded as well.
+                By default, the duper is seeded randomly.
+        """
         self._generators: Dict[Hashable, Generator] = {}
+        self._generator_cache: OrderedDict[
+            Hashable, Type[Generator]
+        ] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._rng = np.random.default_rng(seed)
 
     def __getitem__(self, item: Hashable):
         return self.generators[item]
@@ -82,18 +135,48 @@ class Duper:
         best generator is derived from data and type of each column. Second, the
         generator is fitted to the data.
 
+        The best generator of non-object columns is cached, so refitting on
+        identical data skips its derivation. The cache keeps the most recently
+        used columns only. See :meth:`clear_cache()`.
+
         Args:
             df (pd.DataFrame): pandas DataFrame with your data.
             category_threshold (float, optional): fraction of unique values
                 until which category duper is perferred, should be in [0,1].
                 Defaults to 0.05.
         """
-        self._generators = {}
-        for col in df.columns:
-            data = df[col]
-            self._generators[col] = analysis.find_best_generator(
-                data=data, category_threshold=category_threshold
-            ).from_data(data)
+
+        def fit_column(col: Hashable, seed: int) -> Generator:
+            data = df[col].to_numpy(copy=False)
+            key = _signature(data, category_threshold)
+            with self._cache_lock:
+                generator_class = self._generator_cache.get(key)
+                if generator_class is not None:
+                    self._generator_cache.move_to_end(key)
+            if generator_class is None:
+                generator_class = analysis.find_best_generator(
+                    data=data, category_threshold=category_threshold, seed=seed
+                )
+                if key is not None:
+                    with self._cache_lock:
+                        self._generator_cache[key] = generator_class
+                        if len(self._generator_cache) > _CACHE_SIZE:
+                            self._generator_cache.popitem(last=False)
+            return generator_class.from_data(data, seed=seed)
+
+        # seed the generators in column order, independent of the threads
+        seeds = self._rng.integers(2**63, size=len(df.columns))
+        with _executor(len(df.columns)) as executor:
+            self._generators = dict(
+                zip(df.columns, executor.map(fit_column, df.columns, seeds))
+            )
+
+    def clear_cache(self) -> None:
+        """Clears the generator classes cached by :meth:`fit()`. Refitting on
+        identical columns reuses the generator class chosen before.
+        """
+        with self._cache_lock:
+            self._generator_cache.clear()
 
     def make(self, size: int, with_na: bool = False) -> pd.DataFrame:
         """Create a new random pandas DataFrame after fitting the generator.
@@ -106,14 +189,55 @@ class Duper:
         Returns:
             pd.DataFrame: generated new data set
         """
-        df = pd.DataFrame(data=None, index=None, columns=self.columns).astype(
-            self.dtypes
-        )
-
-        for col in self.columns:
+        na_draws: Dict[Hashable, NDArray] = {}
+        if with_na and size <= generator_base._CHUNK_SIZE:
+            # draw the NA masks of all columns with frequent NA in one go, the
+            # generators draw the positions of sparse NA themselves. Larger
+            # data frames are left to the generators, which draw NA by chunk.
+            na_columns = [
+                col
+                for col, gen in self.generators.items()
+                if gen.na_rate >= generator_base._SPARSE_NA_RATE
+            ]
+            draws = self._rng.random(size=(len(na_columns), size))
+            na_draws = dict(zip(na_columns, draws))
+
+        def make_column(item: Tuple[Hashable, Generator]) -> pd.Series:
+            col, gen = item
             try:
-                df[col] = self.generators[col].make(size=size, with_na=with_na)
+                return gen.make(
+                    size=size, with_na=with_na, na_draw=na_draws.get(col)
+                )
             except Exception as e:
                 raise Exception(*e.args, f"column='{col}'")
 
-        return df
+        generators = self.generators
+        with _executor(len(generators)) as executor:
+            data = dict(
+                zip(generators, executor.map(make_column, generators.items()))
+            )
+
+        # the columns are newly made, no need to copy them into blocks
+        return pd.DataFrame(data=data, copy=False)
+
+    def make_batches(
+        self, size: int, batch_size: int = 1_000_000, with_na: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """Create a new random data set in batches of pandas DataFrames. Use this
+        to generate data sets that do not fit into memory, e.g. by writing each
+        batch to disk or passing it to an out-of-core library.
+
+        Args:
+            size (int): the total number of rows of all batches
+            batch_size (int, optional): the maximal number of rows of a batch.
+                Defaults to 1,000,000.
+            with_na (bool, optional): NA values can be replicated to the new
+            data frame. Defaults to False.
+
+        Yields:
+            pd.DataFrame: generated batch, indexed consecutively over batches
+        """
+        for start in range(0, size, batch_size):
+            df = self.make(size=min(batch_size, size - start), with_na=with_na)
+            df.index = pd.RangeIndex(start, start + len(df))
+            yield df
@@ -3,18 +3,32 @@ Module containing the abstract base class for all generators.
 """
 from __future__ import annotations
 
-from typing import List
+from typing import Any, FrozenSet, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 from numpy.typing import ArrayLike, DTypeLike, NDArray
 
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+"""Seed types accepted by :func:`numpy.random.default_rng`."""
+
+_CHUNK_SIZE = 1_000_000
+"""Number of elements made at once, bounds the size of temporary arrays."""
+
+_SPARSE_NA_RATE = 0.05
+"""NA rate below which NA positions are drawn directly instead of drawing a
+uniform number for each element."""
+
 
 class Generator:
     """Abstract base class of the value generators."""
 
     DATA_DTYPES: List[DTypeLike] = []
-    """Accepted data types of the generator."""
+    """Accepted data types of the generator. Data types of the same kind are
+    accepted as well, e.g. int32 for int64."""
+
+    _DATA_KINDS: FrozenSet[str] = frozenset()
+    """Kinds of the accepted data types, derived from :attr:`DATA_DTYPES`."""
 
     dtype: DTypeLike = None
     """Data type of the generated array."""
@@ -22,8 +36,50 @@ class Generator:
     na_rate: float = 0.0
     """Ratio of NA values in generated array."""
 
+    na_value: Any = np.nan
+    """Value of NA in generated array, NaT for datetime and timedelta data."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._DATA_KINDS = frozenset(np.dtype(dt).kind for dt in cls.DATA_DTYPES)
+
+    def __init__(
+        self,
+        dtype: DTypeLike = None,
+        na_rate: float = 0.0,
+        seed: SeedLike = None,
+    ):
+        """Sets the attributes shared by all generators. Must be called by the
+        initializers of the subclasses.
+
+        Args:
+            dtype (DTypeLike, optional): data type of the generated array.
+            na_rate (float, optional): Rate at which NA occour in the data.
+                Must be in [0,1]. Defaults to 0.0.
+            seed (SeedLike, optional): seed of the random number generator.
+                By default, the generator is seeded randomly.
+        """
+        if na_rate < 0 or na_rate > 1:
+            raise ValueError("na_rate must be in [0,1]")
+        self.dtype = dtype
+        self.na_rate = na_rate
+        self._rng = np.random.default_rng(seed)
+
+        kind = "O" if dtype is None else np.dtype(dtype).kind
+        if kind in "mM":
+            self.na_value = np.array("NaT", dtype=dtype)[()]
+        else:
+            self.na_value = np.nan
+        # integer, boolean and fixed-width string arrays cannot hold NA
+        if kind in "iu":
+            self._na_dtype: DTypeLike = np.float_
+        elif kind in "bOSU":
+            self._na_dtype = np.object_
+        else:
+            self._na_dtype = dtype
+
     @classmethod
-    def from_data(cls, data: NDArray):
+    def from_data(cls, data: NDArray, seed: SeedLike = None):
         raise NotImplementedError
 
     def _make(self, size: int) -> NDArray:
@@ -37,33 +93,83 @@ class Generator:
             NotImplementedError: method must be overwritten.
 
         Returns:
-            NDArray: valid array of given size
+            NDArray: valid array of given size, might be read-only
         """
         raise NotImplementedError
 
-    def make(self, size: int, with_na: bool = True) -> pd.Series:
+    def make(
+        self,
+        size: int,
+        with_na: bool = True,
+        na_draw: Optional[NDArray] = None,
+    ) -> pd.Series:
         """Creates a new data array of a given size. The values are generatored
         randomly for each execution. NA values can be inserted optionally.
+        Large arrays are made in chunks, so that temporary arrays, including
+        the NA draws, are bounded by the chunk size.
 
         Args:
             size (int): number of elements in returned array
             with_na (bool, optional): Allows to replicate NA occurrence in data.
                 If True, NA values are randomly inserted in the data. The rate
                 is fitted from the data. Defaults to True.
+            na_draw (NDArray, optional): uniform random numbers in [0,1) of
+                the given size, from which NA values are inserted. By default,
+                they are drawn from the generator's random number generator.
 
         Returns:
             pd.Series: array with newly generatored values
         """
-        if with_na:
-            is_value = np.random.uniform(size=size) > self.na_rate
-            s = pd.Series(data=np.empty(size), dtype=self.dtype)
-            s.loc[is_value] = pd.Series(
-                data=self._make(size=sum(is_value)), dtype=self.dtype
+        if with_na and self.na_rate > 0.0:
+            data = np.full(size, self.na_value, dtype=self._na_dtype)
+            for start in range(0, size, _CHUNK_SIZE):
+                chunk = slice(start, start + _CHUNK_SIZE)
+                data_chunk = data[chunk]
+                is_value = self._draw_is_value(
+                    size=data_chunk.size,
+                    na_draw=None if na_draw is None else na_draw[chunk],
+                )
+                data_chunk[is_value] = self._make(size=int(is_value.sum()))
+            return pd.Series(data=data)
+        elif size <= _CHUNK_SIZE:
+            values = self._make(size=size)
+            return pd.Series(
+                data=values, dtype=self.dtype, copy=not values.flags.writeable
             )
-            s.loc[~is_value] = pd.NA
-            return s
         else:
-            return pd.Series(data=self._make(size=size), dtype=self.dtype)
+            # strings are collected as objects, their length is not fixed
+            kind = "O" if self.dtype is None else np.dtype(self.dtype).kind
+            data = np.empty(
+                size, dtype=np.object_ if kind in "OSU" else self.dtype
+            )
+            for start in range(0, size, _CHUNK_SIZE):
+                chunk = slice(start, start + _CHUNK_SIZE)
+                data[chunk] = self._make(size=data[chunk].size)
+            return pd.Series(data=data, dtype=self.dtype)
+
+    def _draw_is_value(
+        self, size: int, na_draw: Optional[NDArray] = None
+    ) -> NDArray:
+        """Draws which elements hold a value and which are NA.
+
+        Args:
+            size (int): number of elements
+            na_draw (NDArray, optional): uniform random numbers in [0,1) of
+                the given size. By default, they are drawn from the generator's
+                random number generator.
+
+        Returns:
+            NDArray: boolean array, True where an element holds a value
+        """
+        if na_draw is None and self.na_rate < _SPARSE_NA_RATE:
+            # few NA: draw their count, then their distinct positions
+            n_na = self._rng.binomial(size, self.na_rate)
+            is_value = np.ones(size, dtype=np.bool_)
+            is_value[self._rng.choice(size, size=n_na, replace=False)] = 0
+            return is_value
+        if na_draw is None:
+            na_draw = self._rng.random(size=size)
+        return na_draw > self.na_rate
 
     @classmethod
     def validate(cls, data: ArrayLike) -> NDArray:
@@ -85,9 +191,7 @@ class Generator:
         if data.size == 0:
             raise ValueError("data must not be empty")
 
-        if len(cls.DATA_DTYPES) > 0 and not any(
-            [np.issubdtype(data.dtype, dt) for dt in cls.DATA_DTYPES]
-        ):
+        if cls._DATA_KINDS and data.dtype.kind not in cls._DATA_KINDS:
             dtypes_repr = ", ".join(map(str, cls.DATA_DTYPES))
             raise TypeError(f"data must be subdtypes of {dtypes_repr}")
 
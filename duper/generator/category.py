@@ -3,11 +3,41 @@ A generator for data with few different values, e.g. category, status.
 """
 from __future__ import annotations
 
+from functools import cached_property
+from typing import Optional, Tuple
+
 import numpy as np
 import pandas as pd
-from numpy.typing import DTypeLike, NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+from .. import helper
+from . import base
+from .base import Generator, SeedLike
+
 
-from .base import Generator
+def _alias_table(p: NDArray) -> Tuple[NDArray, NDArray]:
+    """Builds the table of Vose's alias method, which allows to draw from a
+    discrete distribution in constant time per draw.
+
+    Args:
+        p (NDArray): probabilities of the values, must sum up to 1.
+
+    Returns:
+        Tuple[NDArray, NDArray]: probability to keep each value and index of
+        the alias drawn otherwise.
+    """
+    scaled = p * p.size
+    prob = np.ones(p.size)
+    alias = np.arange(p.size)
+    small = list(np.flatnonzero(scaled < 1))
+    large = list(np.flatnonzero(scaled >= 1))
+    while small and large:
+        s, g = small.pop(), large[-1]
+        prob[s], alias[s] = scaled[s], g
+        scaled[g] -= 1 - scaled[s]
+        if scaled[g] < 1:
+            small.append(large.pop())
+    return prob, alias
 
 
 class Category(Generator):
@@ -18,20 +48,27 @@ class Category(Generator):
 
     def __init__(
         self,
-        vals: NDArray,
-        p: NDArray,
+        vals: ArrayLike,
+        p: ArrayLike,
         dtype: DTypeLike = None,
         na_rate: float = 0.0,
+        seed: SeedLike = None,
+        stratified: bool = False,
     ):
         """Formal initializer. Consider using :meth:`from_data()` instead.
 
         Args:
-            vals (NDArray): 1-dimensional array of value options
-            p (NDArray): propability array of floats, same shape as **vals**
+            vals (ArrayLike): 1-dimensional array of value options
+            p (ArrayLike): propability array of floats, same shape as **vals**
             dtype (DTypeLike, optional): by default, dtype is derived from
                 **vals**. Optionally, a valid numpy dtype can be provided.
             na_rate (float, optional): Rate at which NA occour in the data.
                 Must be in [0,1]. Defaults to 0.0.
+            seed (SeedLike, optional): Seed of the random number generator.
+                By default, the generator is seeded randomly.
+            stratified (bool, optional): If True, values are drawn by
+                systematic sampling, which reproduces their propability up to
+                one element per value. Defaults to False.
         """
         vals = np.asarray(vals, dtype=dtype) if dtype else np.asarray(vals)
         p = np.asarray(p, dtype=np.float_)
@@ -40,26 +77,60 @@ class Category(Generator):
             raise ValueError("vals must be 1-dimensional")
         if p.shape != vals.shape:
             raise ValueError("vals and bins do not have the same shape")
+        if vals.size == 0:
+            raise ValueError("vals must not be empty")
+        if (p < 0).any() or p.sum() <= 0:
+            raise ValueError("p must be non-negative with a positive sum")
 
-        self._choices = pd.Series(p, index=vals)
-        self.dtype = dtype or np.array(vals).dtype
-        if na_rate < 0 or na_rate > 1:
-            raise ValueError("na_rate must be in [0,1]")
-        self.na_rate = na_rate
+        # strings are kept as python objects, so that draws only gather
+        # references instead of converting each element for pandas
+        kind = vals.dtype.kind
+        self._vals = vals.astype(np.object_) if kind in "SU" else vals
+        self._vals = np.ascontiguousarray(self._vals)
+        self._p = np.ascontiguousarray(p)
+        # cumulative distribution to draw values via inverse transform
+        self._cdf = np.cumsum(p)
+        self._cdf /= self._cdf[-1]
+        self._alias_prob, self._alias = _alias_table(
+            np.diff(self._cdf, prepend=0)
+        )
+        self.stratified = stratified
+        super().__init__(dtype=dtype or vals.dtype, na_rate=na_rate, seed=seed)
 
     @classmethod
-    def from_data(cls, data: NDArray):
+    def from_data(
+        cls, data: NDArray, seed: SeedLike = None, stratified: bool = False
+    ):
         """Initializes a new category generator from the provided data. This is
         a convenience interface and the preferred method to create a new
         generator instance.
 
         Args:
             data (ArrayLike): Set of valid data to create and fit the generator.
+            seed (SeedLike, optional): Seed of the random number generator.
+                By default, the generator is seeded randomly.
+            stratified (bool, optional): If True, values are drawn by
+                systematic sampling. Defaults to False.
         """
         data = cls.validate(data=data)
-        _choices = pd.value_counts(data, normalize=True, dropna=True)
-        na_rate = pd.isna(data).sum() / data.size
-        return cls(vals=_choices.index, p=_choices, na_rate=na_rate)
+        is_value = ~helper.isna(data)
+        na_rate = 1 - is_value.sum() / data.size
+        if data.dtype.kind == "O":
+            # np.unique sorts, which fails for mixed python objects
+            _choices = pd.value_counts(data[is_value], sort=False)
+            vals, counts = _choices.index, _choices.to_numpy()
+        else:
+            vals, counts = np.unique(data[is_value], return_counts=True)
+        # list the most frequent values first
+        order = np.argsort(-counts, kind="stable")
+        return cls(
+            vals=np.asarray(vals)[order],
+            p=counts[order] / counts.sum(),
+            dtype=data.dtype,
+            na_rate=na_rate,
+            seed=seed,
+            stratified=stratified,
+        )
 
     def __str__(self) -> str:
         catagories_str = self.categories.to_string(
@@ -76,10 +147,55 @@ class Category(Generator):
             f"{catagories_str}"
         )
 
-    @property
+    @cached_property
     def categories(self) -> pd.Series:
-        """pd.Series: lists values and propability"""
-        return self._choices
+        """pd.Series: lists values and propability. Built once on first
+        access, drawing does not depend on it."""
+        return pd.Series(self._p, index=self._vals)
+
+    def make(
+        self,
+        size: int,
+        with_na: bool = True,
+        na_draw: Optional[NDArray] = None,
+    ) -> pd.Series:
+        """Creates a new data array of a given size. The values are generatored
+        randomly for each execution. NA values can be inserted optionally.
+
+        Unless stratified, NA is drawn as an additional category, so a single
+        uniform draw decides between NA and the value of each element.
+
+        Args:
+            size (int): number of elements in returned array
+            with_na (bool, optional): Allows to replicate NA occurrence in data.
+                If True, NA values are randomly inserted in the data. The rate
+                is fitted from the data. Defaults to True.
+            na_draw (NDArray, optional): uniform random numbers in [0,1) of
+                the given size, from which values and NA are drawn. By default,
+                they are drawn from the generator's random number generator.
+
+        Returns:
+            pd.Series: array with newly generatored values
+        """
+        if not with_na or self.na_rate == 0.0 or self.stratified:
+            return super().make(size=size, with_na=with_na, na_draw=na_draw)
+        # NA is the first category, values share the remaining probability
+        cdf = np.empty(self._cdf.size + 1)
+        cdf[0] = self.na_rate
+        cdf[1:] = self.na_rate + (1 - self.na_rate) * self._cdf
+        cdf[-1] = 1.0
+        vals = np.empty(self._vals.size + 1, dtype=self._na_dtype)
+        vals[0] = self.na_value
+        vals[1:] = self._vals
+        data = np.empty(size, dtype=vals.dtype)
+        for start in range(0, size, base._CHUNK_SIZE):
+            chunk = slice(start, start + base._CHUNK_SIZE)
+            if na_draw is None:
+                u = self._rng.random(size=data[chunk].size)
+            else:
+                u = na_draw[chunk]
+            data[chunk] = vals[np.searchsorted(cdf, u, side="right")]
+        return pd.Series(data=data)
 
     def _make(self, size: int) -> NDArray:
         """Hidden maker method. Creates an array of the given **size** by
@@ -91,8 +207,16 @@ class Category(Generator):
         Returns:
             NDArray: 1-d array composed from the generator's **vals**.
         """
-        return np.random.choice(
-            a=self.categories.index,
-            size=size,
-            p=self.categories,
-        )
+        if self.stratified:
+            # counts of the evenly spaced draws (k + r) / size below the cdf
+            r = self._rng.random()
+            bounds = np.ceil(self._cdf * size - r).clip(0, size).astype(np.int_)
+            vals = np.repeat(self._vals, np.diff(bounds, prepend=0))
+            self._rng.shuffle(vals)
+            return vals
+        # the integer part picks a column of the alias table, the fractional
+        # part decides between the column's value and its alias
+        u = self._rng.random(size) * self._vals.size
+        i = np.minimum(u.astype(np.intp), self._vals.size - 1)
+        u -= i
+        return self._vals[np.where(u < self._alias_prob[i], i, self._alias[i])]
@@ -9,7 +9,8 @@ import numpy as np
 import pandas as pd
 from numpy.typing import DTypeLike, NDArray
 
-from .base import Generator
+from .. import helper
+from .base import Generator, SeedLike
 
 
 class Constant(Generator):
@@ -18,7 +19,11 @@ class Constant(Generator):
     """
 
     def __init__(
-        self, value: Any, dtype: DTypeLike = None, na_rate: float = 0.0
+        self,
+        value: Any,
+        dtype: DTypeLike = None,
+        na_rate: float = 0.0,
+        seed: SeedLike = None,
     ):
         """Initializes a new generator based on the provided constant **value**.
 
@@ -28,39 +33,48 @@ class Constant(Generator):
                 **value**. Optionally, a valid numpy dtype can be provided.
             na_rate (float, optional): Rate at which NA occour in the data.
                 Must be in [0,1]. Defaults to 0.0.
+            seed (SeedLike, optional): Seed of the random number generator.
+                By default, the generator is seeded randomly.
         """
         if dtype:
             np.array(value, dtype=dtype)
-        self.dtype = dtype or np.array(value).dtype
+        super().__init__(
+            dtype=dtype or np.array(value).dtype, na_rate=na_rate, seed=seed
+        )
         self.value = value
-        if na_rate < 0 or na_rate > 1:
-            raise ValueError("na_rate must be in [0,1]")
-        self.na_rate = na_rate
 
     @classmethod
-    def from_data(cls, data: NDArray):
+    def from_data(cls, data: NDArray, seed: SeedLike = None):
         """Initializes a new generator from the provided **data**. This is
         a convenience interface and the preferred method to create a new
         generator instance.
 
         Args:
             data (ArrayLike): set of valid data to create and fit the generator.
+            seed (SeedLike, optional): seed of the random number generator.
+                By default, the generator is seeded randomly.
 
         Raise:
             ValueError: if data holds more than one unique value that is not NA.
         """
         data = cls.validate(data=data)
-        # using pandas isna here since dtype might be object/string
-        na_rate = sum(pd.isna(data)) / len(data)
-        unique_values = pd.unique(data[~pd.isna(data)])
+        is_na = helper.isna(data)
+        na_rate = is_na.sum() / data.size
+        unique_values = pd.unique(data[~is_na])
 
         if len(unique_values) > 1:
             raise ValueError("Cannot be inferred from non constant data.")
 
         if len(unique_values) < 1:
-            unique_values = pd.unique(data)
+            # all values are NA, the first one is kept as constant
+            unique_values = data[:1]
 
-        return cls(value=unique_values[0], dtype=data.dtype, na_rate=na_rate)
+        return cls(
+            value=unique_values[0],
+            dtype=data.dtype,
+            na_rate=na_rate,
+            seed=seed,
+        )
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__} with value '{self.value}'"
@@ -73,6 +87,8 @@ class Constant(Generator):
             size (int): number of elements in returned array.
 
         Returns:
-            NDArray: array with one unique value.
+            NDArray: read-only array with one unique value.
         """
-        return np.full(shape=size, fill_value=self.value)
+        # a zero-strided view, the value is not copied to each element
+        value = np.asarray(self.value, dtype=self.dtype)
+        return np.broadcast_to(value, shape=(size,))
@@ -3,13 +3,14 @@ Generators for numeric data that can be inferred from empiric distribution.
 """
 from __future__ import annotations
 
+from functools import cached_property
 from typing import List, Union
 
 import numpy as np
 from numpy.typing import ArrayLike, DTypeLike, NDArray
 
 from .. import helper
-from .base import Generator
+from .base import Generator, SeedLike
 
 
 class QuantileGenerator(Generator):
@@ -22,7 +23,7 @@ class QuantileGenerator(Generator):
 
     """
 
-    DATA_DTYPES: List[DTypeLike] = [np.int_, np.float_, np.datetime64]
+    DATA_DTYPES: List[DTypeLike] = [np.int_, np.uint, np.float_, np.datetime64]
 
     def __init__(
         self,
@@ -30,6 +31,7 @@ class QuantileGenerator(Generator):
         bins: ArrayLike = None,
         dtype: DTypeLike = None,
         na_rate: float = 0.0,
+        seed: SeedLike = None,
     ):
         """Formal initializer. Consider using :meth:`from_data()` instead.
 
@@ -42,6 +44,8 @@ class QuantileGenerator(Generator):
                 **vals**. Optionally, a valid numpy dtype can be provided.
             na_rate (float, optional): Rate at which NaN occour in the data.
                 Must be in [0,1]. Defaults to 0.0.
+            seed (SeedLike, optional): Seed of the random number generator.
+                By default, the generator is seeded randomly.
         """
         _vals = np.asarray(vals, dtype=dtype)
         if len(_vals.shape) != 1:
@@ -54,37 +58,55 @@ class QuantileGenerator(Generator):
             raise ValueError("vals and bins do not have the same shape")
 
         _vals = np.sort(_vals)
-        _mask = np.r_[True, _vals[2:] - _vals[:-2] != np.full(_n - 2, 0), True]
-
-        self.vals = _vals[_mask]
-        self.bins = _bins[_mask]
-        self.dtype = dtype or _vals.dtype
-
-        if na_rate < 0 or na_rate > 1:
-            raise ValueError("na_rate must be in [0,1]")
-        self.na_rate = na_rate
+        # keep the first and last element of each run of duplicates
+        _mask = np.empty(_n, dtype=bool)
+        _mask[0] = _mask[-1] = True
+        np.not_equal(_vals[2:], _vals[:-2], out=_mask[1:-1])
+
+        # contiguous and read-only, the support points are fixed after init
+        self.vals = np.ascontiguousarray(_vals[_mask])
+        self.bins = np.ascontiguousarray(_bins[_mask], dtype=np.float_)
+        self.vals.setflags(write=False)
+        self.bins.setflags(write=False)
+        super().__init__(dtype=dtype or _vals.dtype, na_rate=na_rate, seed=seed)
 
     @classmethod
-    def from_data(cls, data: ArrayLike):
+    def from_data(cls, data: ArrayLike, seed: SeedLike = None):
         """Initializes a new quantile generator from the provided data. This is
         a convenience interface and the preferred method to create a new
         generator instance.
 
         Args:
             data (ArrayLike): Set of valid data to create and fit the generator.
+            seed (SeedLike, optional): Seed of the random number generator.
+                By default, the generator is seeded randomly.
         """
         data = cls.validate(data=data)
-        vals = np.asarray(data[~np.isnan(data)])
-        dtype = data.dtype
-        na_rate = 1 - vals.size / data.size
-        return cls(vals=vals, dtype=dtype, na_rate=na_rate)
+        is_na = helper.isna(data)
+        n_na = int(is_na.sum())
+        # the initializer sorts a copy, so data without NA is passed as is
+        vals = data[np.logical_not(is_na, out=is_na)] if n_na else data
+        na_rate = n_na / data.size
+        return cls(vals=vals, dtype=data.dtype, na_rate=na_rate, seed=seed)
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__} from empiric quantiles"
 
+    def _draw(self, size: int) -> NDArray:
+        """Draws values from the interpolated quantile, as float or datetime
+        values of the support points' unit.
+
+        Args:
+            size (int): number of elements in returned array
+
+        Returns:
+            NDArray: newly allocated array of drawn values
+        """
+        p = self._rng.random(size)
+        return helper.interp(p, self.bins, self.vals)
+
     def _make(self, size: int) -> NDArray:
-        p = np.random.uniform(0, 1, size)
-        return helper.interp(p, self.bins, self.vals).astype(self.dtype)
+        return self._draw(size=size).astype(self.dtype, copy=False)
 
 
 class Numeric(QuantileGenerator):
@@ -97,17 +119,17 @@ class Numeric(QuantileGenerator):
     fitted on the provided data and
     """
 
-    DATA_DTYPES = [np.int_, np.float_]
+    DATA_DTYPES = [np.int_, np.uint, np.float_]
 
-    @property
+    @cached_property
     def precision(self) -> Union[int, float]:
         """Union[int, float]: Precision of the generator, interpreted as the
-        greatest common divisor."""
+        greatest common divisor. Computed once on first access."""
         return helper.gcd(self.vals)
 
     def _make(self, size: int) -> NDArray:
-        """Hidden maker method. This wraps the quantile _make with a rounding
-        function to ensure the values are rounded their initial precision (gcd).
+        """Hidden maker method. This rounds the quantile draws in place to
+        their initial precision (gcd) before casting them to the data type.
 
         Args:
             size (int): number of elements in returned array
@@ -115,7 +137,16 @@ class Numeric(QuantileGenerator):
         Returns:
             NDArray: numeric array rounded to the generators precision
         """
-        return helper.roundx(super()._make(size=size), x=self.precision)
+        values = self._draw(size=size)
+        if np.dtype(self.dtype).kind in "iu":
+            # multiples of an integer precision are exact after the cast
+            np.divide(values, self.precision, out=values)
+            np.rint(values, out=values)
+            int_values = values.astype(self.dtype)
+            int_values *= int(self.precision)
+            return int_values
+        helper.roundx(values, x=self.precision, out=values)
+        return values.astype(self.dtype, copy=False)
 
 
 class Datetime(QuantileGenerator):
@@ -130,10 +161,10 @@ class Datetime(QuantileGenerator):
 
     DATA_DTYPES = [np.datetime64]
 
-    @property
+    @cached_property
     def precision(self) -> str:
         """str: Datetime precision of the generators, represented as *ns*, *ms*,
-        *s*, *m*, *h*, *D*, *M*, and *Y*."""
+        *s*, *m*, *h*, *D*, *M*, and *Y*. Computed once on first access."""
         return helper.datetime_precision(self.vals)
 
     def __str__(self) -> str:
@@ -143,8 +174,8 @@ class Datetime(QuantileGenerator):
         )
 
     def _make(self, size: int) -> NDArray:
-        """Hidden maker method. This wraps the quantile _make with a rounding
-        function to ensure the datetimes are rounded their initial precision.
+        """Hidden maker method. This casts the quantile draws directly to
+        their initial precision, which rounds the datetimes.
 
         Args:
             size (int): number of elements in returned array
@@ -152,4 +183,6 @@ class Datetime(QuantileGenerator):
         Returns:
             NDArray: datetime array rounded to the generators precision
         """
-        return super()._make(size=size).astype(f"datetime64[{self.precision}]")
+        return self._draw(size=size).astype(
+            f"datetime64[{self.precision}]", copy=False
+        )
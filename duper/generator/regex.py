@@ -3,16 +3,76 @@ A generator for string data that follow a fixed structure like IDs.
 """
 from __future__ import annotations
 
-import itertools
+import random
 import re
-from typing import List
+from typing import List, Optional, Set
 
 import numpy as np
-import pandas as pd
 import rstr
 from numpy.typing import DTypeLike, NDArray
 
-from .base import Generator
+from .. import helper
+from .base import Generator, SeedLike
+
+try:  # python >= 3.11
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:
+    import sre_parse  # type: ignore
+
+_MAX_FIXED_WIDTH = 1024
+"""Maximal string length of expressions drawn into a fixed-width array."""
+
+_REGEX_ESCAPES = str.maketrans(
+    {
+        ".": r"\.",
+        "^": r"\^",
+        "$": r"\$",
+        "*": r"\*",
+        "+": r"\+",
+        "-": r"\-",
+        "?": r"\?",
+        "(": r"\(",
+        ")": r"\)",
+        "[": r"\[",
+        "]": r"\]",
+        "{": r"\{",
+        "}": r"\}",
+        "\\": r"\\\\",
+        "|": r"\|",
+        "/": r"\/",
+    }
+)
+"""Translation table to escape special regex characters."""
+
+_CHAR_CLASS = re.compile(r"\[(?!\^)((?:\\[^a-zA-Z0-9]|[^\\\]])+)\]")
+"""Character class without negation and special sequences, e.g. [A-F]."""
+
+_CHAR_CLASS_TOKEN = re.compile(r"\\.|[^\\]")
+"""Single, potentially escaped character within a character class."""
+
+_CHAR_RUN = re.compile(r"[0-9]{3,}|[a-z]{3,}|[A-Z]{3,}")
+"""Sequence of at least three digits, lowercase, or uppercase letters."""
+
+
+def _compress_char_run(match: re.Match) -> str:
+    """Replaces runs of at least three consecutive characters in a sequence
+    of characters by a range, e.g. '0123789' becomes '0-37-9'.
+
+    Args:
+        match (re.Match): match of :data:`_CHAR_RUN`.
+
+    Returns:
+        str: the sequence with compressed ranges.
+    """
+    chars = match.group(0)
+    compressed = ""
+    start = 0
+    for end in range(1, len(chars) + 1):
+        if end == len(chars) or ord(chars[end]) != ord(chars[end - 1]) + 1:
+            run = chars[start:end]
+            compressed += f"{run[0]}-{run[-1]}" if len(run) >= 3 else run
+            start = end
+    return compressed
 
 
 class Regex(Generator):
@@ -26,7 +86,11 @@ class Regex(Generator):
     DATA_DTYPES: List[DTypeLike] = [np.str_, np.object_]
 
     def __init__(
-        self, regex: str, dtype: DTypeLike = None, na_rate: float = 0.0
+        self,
+        regex: str,
+        dtype: DTypeLike = None,
+        na_rate: float = 0.0,
+        seed: SeedLike = None,
     ):
         """Initializes a new generator based on the provided regular expression.
         Consider using :meth:`from_data()` to fit the expression from data.
@@ -37,13 +101,30 @@ class Regex(Generator):
                 **value**. Optionally, a valid numpy dtype can be provided.
             na_rate (float, optional): rate at which NA occour in the data.
                 Must be in [0,1]. Defaults to 0.0.
+            seed (SeedLike, optional): seed of the random number generator.
+                By default, the generator is seeded randomly.
         """
+        super().__init__(dtype=dtype, na_rate=na_rate, seed=seed)
         self.regex = regex
-        self.dtype = dtype
-        self.na_rate = na_rate
+        self._pos_chars = self._parse_regex(regex)
+        # strings with the same characters allowed at every position, like IDs,
+        # can be drawn in a single gather
+        self._same_chars = None
+        if self._pos_chars and all(
+            np.array_equal(pc, self._pos_chars[0]) for pc in self._pos_chars
+        ):
+            self._same_chars = self._pos_chars[0]
+        # rstr draws from python's random, seeded from the numpy generator
+        self._rstr = rstr.Rstr(random.Random(int(self._rng.integers(2**63))))
+        # strings of bounded length are drawn directly into a fixed-width array
+        self._max_width: Optional[int] = None
+        if self._pos_chars is None:
+            max_width = sre_parse.parse(regex).getwidth()[1]
+            if max_width < _MAX_FIXED_WIDTH:
+                self._max_width = max(max_width, 1)
 
     @classmethod
-    def from_data(cls, data: NDArray):
+    def from_data(cls, data: NDArray, seed: SeedLike = None):
         """Initializes a new generator from the provided **data**. This is
         a convenience interface and the preferred method to create a new
         generator instance.
@@ -53,12 +134,17 @@ class Regex(Generator):
 
         Args:
             data (NDArray): set of data, interpreted as strings
+            seed (SeedLike, optional): seed of the random number generator.
+                By default, the generator is seeded randomly.
         """
         data = cls.validate(data=data)
-        vals = np.asarray(data[~pd.isna(data)]).astype(np.str_)
-        na_rate = 1 - vals.size / data.size
+        is_na = helper.isna(data)
+        n_na = int(is_na.sum())
+        vals = data[np.logical_not(is_na, out=is_na)] if n_na else data
+        vals = vals.astype(np.str_, copy=False)
+        na_rate = n_na / data.size
         regex = cls._beautify_regex(cls._train_regex(vals))
-        return cls(regex=regex, dtype=data.dtype, na_rate=na_rate)
+        return cls(regex=regex, dtype=data.dtype, na_rate=na_rate, seed=seed)
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__} with '{self.regex}'>"
@@ -73,13 +159,77 @@ class Regex(Generator):
         Returns:
             NDArray: array of strings.
         """
-        return np.array([rstr.xeger(self.regex) for _ in range(size)])
+        if self._pos_chars is None:
+            strings = (self._rstr.xeger(self.regex) for _ in range(size))
+            if self._max_width is not None:
+                dtype = f"U{self._max_width}"
+                return np.fromiter(strings, dtype=dtype, count=size)
+            return np.array(list(strings))
+
+        # draw the characters position by position and join them via view
+        n_pos = len(self._pos_chars)
+        if self._same_chars is not None:
+            n_chars = self._same_chars.size
+            chars = self._same_chars[
+                self._rng.integers(n_chars, size=(size, n_pos))
+            ]
+        else:
+            chars = np.empty((size, n_pos), dtype="U1")
+            for k, pos_chars in enumerate(self._pos_chars):
+                chars[:, k] = pos_chars[
+                    self._rng.integers(pos_chars.size, size=size)
+                ]
+        return chars.view(f"U{n_pos}").ravel()
+
+    @staticmethod
+    def _parse_regex(regex: str) -> Optional[List[NDArray]]:
+        """Parses a regular expression of consecutive character classes, as
+        built by :meth:`_train_regex()`, into the characters allowed at each
+        position. This allows to draw strings without walking the expression.
+
+        Args:
+            regex (str): a regular expression
+
+        Returns:
+            Optional[List[NDArray]]: sorted characters allowed at each position,
+            None if the expression is not a sequence of character classes.
+
+        Examples:
+            >>> Regex._parse_regex('[A-C][\\-][13-4]')
+            [array(['A', 'B', 'C'], dtype='<U1'), array(['-'], dtype='<U1'),
+            array(['1', '3', '4'], dtype='<U1')]
+        """
+        pos_chars = []
+        end = 0
+        for match in _CHAR_CLASS.finditer(regex):
+            if match.start() != end:
+                return None
+            end = match.end()
+
+            tokens = _CHAR_CLASS_TOKEN.findall(match.group(1))
+            chars: Set[str] = set()
+            i = 0
+            while i < len(tokens):
+                if i + 2 < len(tokens) and tokens[i + 1] == "-":
+                    first, last = ord(tokens[i][-1]), ord(tokens[i + 2][-1])
+                    chars.update(map(chr, range(first, last + 1)))
+                    i += 3
+                else:
+                    chars.add(tokens[i][-1])
+                    i += 1
+            if not chars:
+                return None
+            pos_chars.append(np.array(sorted(chars), dtype="U1"))
+
+        if end != len(regex) or not pos_chars:
+            return None
+        return pos_chars
 
     @staticmethod
     def _train_regex(data: NDArray[np.str_]) -> str:
         """Simple algorithm to fit a regular expression on a set of strings.
 
-        It loops the strings character by character, takes the n-th
+        It views the strings as a matrix of characters, takes the n-th
         characters of each string and builds a regular expression, allowing
         only those characters at this position.
 
@@ -92,50 +242,25 @@ class Regex(Generator):
             str: raw regular expression, potentially bloated.
 
         """
-        # break words in data into list of characters
-        char_array = map(list, data)
-        # transpose character matrix: sublists hold i-th char of each value
-        char_array_transposed = map(
-            list, itertools.zip_longest(*char_array, fillvalue="")
-        )
-        # reduce list to unique values and sort
-        unique_chars = map(
-            np.sort,
-            np.array(
-                list(map(list, map(set, char_array_transposed))), dtype=object
-            ),
-        )
-        # account for special regex characters
-        replace_dict = {
-            ".": r"\.",
-            "^": r"\^",
-            "$": r"\$",
-            "*": r"\*",
-            "+": r"\+",
-            "-": r"\-",
-            "?": r"\?",
-            "(": r"\(",
-            ")": r"\)",
-            "[": r"\[",
-            "]": r"\]",
-            "{": r"\{",
-            "}": r"\}",
-            "\\": r"\\\\",
-            "|": r"\|",
-            "/": r"\/",
-        }
-        regex = map(
-            lambda x: f"[{x}]",
-            map(
-                "".join,
-                [
-                    map(lambda c: replace_dict.get(c, c), uc)
-                    for uc in unique_chars
-                ],
-            ),
+        # view strings as matrix of code points, shorter ones are padded by 0
+        data = np.ascontiguousarray(data, dtype=np.str_)
+        if data.size == 0:
+            return ""
+        code_matrix = data.view(np.uint32).reshape(data.size, -1)
+        # reduce each column to its sorted unique characters via a presence
+        # table, which avoids sorting the column
+        unique_chars = []
+        for column in code_matrix.T:
+            seen = np.bincount(column)
+            seen[0] = 0
+            codes = np.flatnonzero(seen).astype(np.uint32)
+            # positions beyond the longest string, e.g. of empty strings only
+            if codes.size:
+                unique_chars.append(codes.view("U1"))
+        # merge characters to regex, accounting for special regex characters
+        return "".join(
+            f"[{''.join(uc).translate(_REGEX_ESCAPES)}]" for uc in unique_chars
         )
-        # merge lists of characters to regex
-        return "".join(regex)
 
     @staticmethod
     def _beautify_regex(regex: str) -> str:
@@ -150,19 +275,6 @@ class Regex(Generator):
 
         Examples:
             >>> Regex._beautify_regex('[ABCD][123789][xyz]')
-            '[A-D][1-37-9][x-y]'
+            '[A-D][1-37-9][x-z]'
         """
-        for chars in [
-            range(ord("0"), ord("9") - 1),
-            range(ord("a"), ord("z") - 1),
-            range(ord("A"), ord("Z") - 1),
-        ]:
-            for i in chars:
-                find_str = chr(i) + chr(i + 1) + chr(i + 2)
-                replace_str = chr(i) + "-" + chr(i + 2)
-                regex = regex.replace(find_str, replace_str)
-                if i not in [ord("9") - 2, ord("a") - 2, ord("Z") - 2]:
-                    find_str = "-" + chr(i + 2) + chr(i + 3)
-                    replace_str = "-" + chr(i + 3)
-                    regex = regex.replace(find_str, replace_str)
-        return re.sub(r"\-[a-zA-Z0-9]\-", "-", regex)
+        return _CHAR_RUN.sub(_compress_char_run, regex)
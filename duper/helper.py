@@ -1,17 +1,58 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
+import pandas as pd
 from numpy.typing import ArrayLike, NDArray
 
 
-def roundx(a: ArrayLike, x: Union[int, float] = 1) -> NDArray:
+def isna(a: ArrayLike) -> NDArray:
+    """Detects NA values in an array. Unlike pandas.isna, the check is chosen
+    by data type: *NaN* for floats, *NaT* for datetimes, and none for data
+    types that cannot hold NA. Only object arrays are passed to pandas.isna.
+
+    Args:
+        a (ArrayLike): array of any data type
+
+    Returns:
+        NDArray: boolean array, True where **a** is NA
+
+    Examples:
+        The function works like pandas.isna on numpy arrays.
+
+        >>> a = np.array([1.5, np.nan, 3.0])
+        >>> helper.isna(a)
+        array([False,  True, False])
+
+        Integer arrays cannot hold NA.
+
+        >>> a = np.array([15, 180, 45])
+        >>> helper.isna(a)
+        array([False, False, False])
+    """
+    a = np.asarray(a)
+    kind = a.dtype.kind
+    if kind in "fc":
+        return np.isnan(a)
+    if kind in "mM":
+        return np.isnat(a)
+    if kind == "O":
+        return pd.isna(a)
+    return np.zeros(a.shape, dtype=np.bool_)
+
+
+def roundx(
+    a: ArrayLike, x: Union[int, float] = 1, out: Optional[NDArray] = None
+) -> NDArray:
     """Rounds values to the closest multiple of **x**.
 
     Args:
         a (ArrayLike): numeric array
         x (Union[int, float], optional): int or float. Defaults to 1.
+        out (NDArray, optional): float array of the same shape as **a** to
+            store the result in, can be **a** itself. By default, a new
+            array is allocated.
 
     Returns:
         NDArray: array of rounded values
@@ -29,8 +70,11 @@ def roundx(a: ArrayLike, x: Union[int, float] = 1) -> NDArray:
         >>> helper.roundx(a, 0.7)
         array([9.8, 4.2, 3.5])
     """
-    a = np.asarray(a)
-    return np.around(x * np.around(a / x), number_precision((x,)))
+    # round in place on the quotient, the only temporary array
+    r = np.divide(a, x, out=out)
+    np.around(r, out=r)
+    np.multiply(r, x, out=r)
+    return np.around(r, number_precision((x,)), out=r)
 
 
 def number_precision(a: ArrayLike, max: int = 16) -> int:
@@ -61,9 +105,15 @@ def number_precision(a: ArrayLike, max: int = 16) -> int:
 
         In the example above, rounding **a** with decimals -1 has no impact.
     """
-    a = np.asarray(a)[~np.isnan(np.asarray(a))]
+    a = np.asarray(a)
+    a = a[~isna(a)] if a.dtype.kind == "f" else a
     d = -int(np.ceil(np.log10(np.abs(np.amax(a)))))
-    while any(a != np.around(a, d)) and d < max:
+    # a lossy rounding of the head is enough to reject a precision, so that
+    # the full array is only checked for promising precisions
+    head = a[:1024]
+    while d < max and (
+        (head != np.around(head, d)).any() or (a != np.around(a, d)).any()
+    ):
         d += 1
     return d
 
@@ -91,8 +141,10 @@ def gcd(a: ArrayLike) -> Union[int, float]:
         15
     """
     a = np.asarray(a)
+    if a.dtype.kind in "iu":
+        return np.gcd.reduce(a).item()
     n = number_precision(a)
-    int_repr = np.around(a * (10**n)).astype(np.int_)
+    int_repr = np.rint(a * (10.0**n)).astype(np.int_)
     gcd_float = np.around(np.gcd.reduce(int_repr) / (10**n), decimals=n)
     return a.dtype.type(gcd_float).item()
 
@@ -116,19 +168,31 @@ def datetime_precision(a: ArrayLike) -> str:
         >>> datetime_precision(a)
         'h'
     """
-    a = np.asarray(a)
-    freq = "ns"
-    for f in ["ms", "s", "m", "h", "D", "M", "Y"]:
-        if any(a != a.astype(f"datetime64[{f}]")):
-            break
-        else:
+    arr: NDArray = np.asarray(a)
+    arr = arr[~np.isnat(arr)]
+    unit, count = np.datetime_data(arr.dtype)
+    freq = "ns" if unit not in ["M", "Y"] else "D"
+    if freq == "ns":
+        # all values are multiples of the gcd of their integer representation
+        ticks = np.gcd.reduce(arr.view(np.int64)) if arr.size else 0
+        for f in ["ms", "s", "m", "h", "D"]:
+            step = np.timedelta64(1, f) / np.timedelta64(count, unit)
+            if step > 1 and ticks % int(step) != 0:
+                return freq
             freq = f
-    return freq
+    # months are not of fixed length, but years are multiples of 12 months
+    months = arr.astype("datetime64[M]")
+    if (arr != months).any():
+        return freq
+    if (months.view(np.int64) % 12).any():
+        return "M"
+    return "Y"
 
 
 def interp(x: ArrayLike, xp: ArrayLike, fp: ArrayLike) -> NDArray:
     """One-dimensional linear interpolation for monotonically increasing points.
-    Note: numpy.interp does not work with datetime values.
+    Note: numpy.interp does not work with datetime values, which are hence
+    interpolated on their integer representation.
 
     Args:
         x (ArrayLike): x-coordinates at which to evaluate the interpolation.
@@ -159,8 +223,11 @@ def interp(x: ArrayLike, xp: ArrayLike, fp: ArrayLike) -> NDArray:
     x = np.asarray(x)
     xp = np.asarray(xp)
     fp = np.asarray(fp)
-    # TODO: add checks and exceptions
-    i = np.searchsorted(xp, x)
-    return np.asarray(
-        (x - xp[i - 1]) / (xp[i] - xp[i - 1]) * (fp[i] - fp[i - 1]) + fp[i - 1]
-    )
+    if fp.dtype.kind in "mM":
+        # interpolate the integer offsets from the first point, which are
+        # exact in float64 unlike absolute nanoseconds, floored to the unit
+        base = fp.view(np.int64)[0]
+        f = np.interp(x, xp, fp.view(np.int64) - base)
+        np.floor(f, out=f)
+        return (f.astype(np.int64) + base).view(fp.dtype)
+    return np.interp(x, xp, fp)
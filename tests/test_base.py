@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import duper
 from duper import Duper, generator
 
 
@@ -56,3 +57,169 @@ def test_NaT_column():
     duper.generators["nat"].value
     assert np.isnat(duper.generators["nat"].value)
     assert all(np.isnat(duper.make(size=10)))
+
+
+def test_sized_numeric_columns():
+    df = pd.DataFrame(
+        data={
+            "int32": np.arange(20, dtype=np.int32) * 3,
+            "uint16": np.arange(20, dtype=np.uint16),
+            "float32": np.linspace(0, 1, 20, dtype=np.float32),
+        }
+    )
+
+    duper = Duper()
+    duper.fit(df)
+
+    assert all(
+        isinstance(gen, generator.Numeric) for gen in duper.generators.values()
+    )
+    assert all(duper.make(size=10).dtypes == df.dtypes)
+
+
+def test_refit(monkeypatch, df_train):
+    calls = []
+    find_best_generator = duper.analysis.find_best_generator
+
+    def counting_find_best_generator(data, **kwargs):
+        calls.append(data.dtype)
+        return find_best_generator(data, **kwargs)
+
+    monkeypatch.setattr(
+        duper.analysis, "find_best_generator", counting_find_best_generator
+    )
+    n_cached = int((df_train.dtypes != object).sum())
+
+    dup = Duper()
+    dup.fit(df=df_train)
+    generator_types = list(map(type, dup.generators.values()))
+    assert len(dup._generator_cache) == n_cached
+    assert len(calls) == df_train.shape[1]
+
+    # object columns are not cached, all other columns skip the analysis
+    calls.clear()
+    dup.fit(df=df_train)
+    assert list(map(type, dup.generators.values())) == generator_types
+    assert len(calls) == df_train.shape[1] - n_cached
+
+    dup.clear_cache()
+    assert dup._generator_cache == {}
+    calls.clear()
+    dup.fit(df=df_train)
+    assert list(map(type, dup.generators.values())) == generator_types
+    assert len(calls) == df_train.shape[1]
+
+
+def test_sized_category_columns():
+    df = pd.DataFrame(
+        data={
+            "int32": np.array([1, 2] * 50, dtype=np.int32),
+            "uint8": np.array([1, 2] * 50, dtype=np.uint8),
+            "float32": np.array([0.5, 1.0] * 50, dtype=np.float32),
+        }
+    )
+
+    duper = Duper()
+    duper.fit(df)
+
+    assert all(
+        isinstance(gen, generator.Category) for gen in duper.generators.values()
+    )
+    assert duper.dtypes == df.dtypes.to_dict()
+    assert all(duper.make(size=10).dtypes == df.dtypes)
+
+
+def test_seed(df_train):
+    df = df_train.assign(na=[np.nan, 0.5, 1.5, 2.0] * 5)
+    dupes = []
+    for _ in range(2):
+        duper = Duper(seed=42)
+        duper.fit(df=df)
+        dupes.append(duper.make(size=100, with_na=True))
+    pd.testing.assert_frame_equal(dupes[0], dupes[1])
+
+
+def test_make_batches(df_train):
+    duper = Duper()
+    duper.fit(df=df_train)
+    batches = list(duper.make_batches(size=250, batch_size=100))
+
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    df_dupe = pd.concat(batches)
+    assert df_dupe.index.equals(pd.RangeIndex(250))
+    assert df_dupe.dtypes.to_dict() == df_train.dtypes.to_dict()
+
+
+def test_timedelta_na_column():
+    df = pd.DataFrame(
+        data={"timedelta": np.array([1, 2, "NaT", 1] * 5, dtype="m8[s]")}
+    )
+    duper = Duper()
+    duper.fit(df=df)
+    df_dupe = duper.make(size=100, with_na=True)
+
+    assert type(duper["timedelta"]) is generator.Category
+    assert df_dupe["timedelta"].dtype.kind == "m"
+
+
+def test_make_chunks(monkeypatch, df_train):
+    monkeypatch.setattr(duper.generator.base, "_CHUNK_SIZE", 7)
+    df_train.loc[::4, ["integer", "float", "string"]] = np.nan
+    dup = Duper(seed=0)
+    dup.fit(df_train)
+    df_new = dup.make(size=50, with_na=True)
+    assert df_new.shape == (50, df_train.shape[1])
+    assert df_new[["integer", "float", "string"]].isna().any().all()
+
+
+@pytest.fixture
+def small_sample(monkeypatch):
+    monkeypatch.setattr(duper.analysis, "_SAMPLE_THRESHOLD", 1000)
+    monkeypatch.setattr(duper.analysis, "_SAMPLE_SIZE", 200)
+
+
+def test_clearly_categorical(small_sample):
+    data = np.array([0.5, 1.0, 2.0] * 2000)
+
+    assert duper.analysis._is_clearly_categorical(data, 0.05, seed=0)
+    assert duper.analysis.find_best_generator(data, 0.05) is generator.Category
+
+
+def test_inconclusive_sample(small_sample):
+    # 40 unique values in 6000 rows are categorical, not so in a sample of 200
+    data = np.arange(6000) % 40 / 7
+
+    assert not duper.analysis._is_clearly_categorical(data, 0.05, seed=0)
+    assert duper.analysis.find_best_generator(data, 0.05) is generator.Category
+
+    data = np.arange(6000) / 7
+    assert not duper.analysis._is_clearly_categorical(data, 0.05, seed=0)
+    assert duper.analysis.find_best_generator(data, 0.05) is generator.Numeric
+
+
+def test_refit_cache_eviction(monkeypatch):
+    calls = []
+    find_best_generator = duper.analysis.find_best_generator
+
+    def counting_find_best_generator(data, **kwargs):
+        calls.append(data[0])
+        return find_best_generator(data, **kwargs)
+
+    monkeypatch.setattr(
+        duper.analysis, "find_best_generator", counting_find_best_generator
+    )
+    monkeypatch.setattr(duper.base, "_CACHE_SIZE", 2)
+    df_a, df_b, df_c = (
+        pd.DataFrame({"x": np.arange(20) + offset}) for offset in [0, 100, 200]
+    )
+
+    dup = Duper()
+    for df in [df_a, df_b, df_a, df_c]:
+        dup.fit(df)
+    # a was used after b, so b is evicted when c is cached
+    assert len(dup._generator_cache) == 2
+    assert calls == [0, 100, 200]
+
+    dup.fit(df_a)
+    dup.fit(df_b)
+    assert calls == [0, 100, 200, 100]
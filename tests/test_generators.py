@@ -1,3 +1,5 @@
+import re
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -31,6 +33,24 @@ def test_Generator_dtype(test):
     assert duper.dtype == test["dtype"]
 
 
+@pytest.mark.parametrize("with_na", [False, True])
+@pytest.mark.parametrize(
+    "duper",
+    [
+        generator.Constant(value="a", na_rate=0.5),
+        generator.Numeric(vals=[1, 5, 10], na_rate=0.5),
+        generator.Regex(regex=r"[ab]c+", dtype=object, na_rate=0.5),
+        generator.Category(vals=["a", "b"], p=[0.5, 0.5], na_rate=0.5),
+        generator.Constant(value="a", na_rate=0.04, seed=0),
+    ],
+)
+def test_Generator_chunks(monkeypatch, duper, with_na):
+    monkeypatch.setattr(generator.base, "_CHUNK_SIZE", 7)
+    duped_values = duper.make(size=100, with_na=with_na)
+    assert len(duped_values) == 100
+    assert duped_values.isna().any() == with_na
+
+
 # Constant generator
 
 
@@ -71,6 +91,34 @@ def test_ConstantGenerator_all_na():
     assert all(duped_values.isna())
 
 
+@pytest.mark.parametrize("na_rate", [0.01, 0.3])
+def test_ConstantGenerator_na_rate(na_rate):
+    duper = generator.Constant(value=1, na_rate=na_rate, seed=42)
+    duped_values = duper.make(size=100_000, with_na=True)
+    assert duped_values.isna().mean() == pytest.approx(na_rate, rel=0.1)
+
+
+def test_ConstantGenerator_timedelta_na():
+    duper = generator.Constant(value=np.timedelta64(3, "s"), na_rate=0.5)
+    duped_values = duper.make(size=100, with_na=True)
+    assert duped_values.dtype.kind == "m"
+    assert duped_values.isna().any()
+
+
+def test_ConstantGenerator_seed():
+    dupes = [
+        generator.Constant(value=3, na_rate=0.5, seed=42).make(size=100)
+        for _ in range(2)
+    ]
+    assert all(dupes[0].isna() == dupes[1].isna())
+
+
+def test_ConstantGenerator_writable():
+    duped_values = generator.Constant(value="a").make(size=10)
+    duped_values[0] = "b"
+    assert duped_values.tolist() == ["b"] + ["a"] * 9
+
+
 def test_ConstantGenerator_Wrong_dtype():
     with pytest.raises(ValueError):
         generator.Constant(value="test", dtype=int)
@@ -89,6 +137,64 @@ def test_ConstantGenerator_fail_infer():
         generator.Constant.from_data(data)
 
 
+# Category generator
+
+
+def test_CategoryGenerator_make():
+    duper = generator.Category(vals=["a", "b", "c"], p=[0.25, 0.0, 0.75])
+    duped_values = duper.make(size=1000)
+    assert set(duped_values) == {"a", "c"}
+    assert 0.6 < (duped_values == "c").mean() < 0.9
+
+
+def test_CategoryGenerator_make_na():
+    duper = generator.Category(vals=[1, 2], p=[0.5, 0.5], na_rate=0.4)
+    duped_values = duper.make(size=1000, with_na=True)
+    assert set(duped_values.dropna()) == {1, 2}
+    assert 0.3 < duped_values.isna().mean() < 0.5
+
+
+def test_CategoryGenerator_timedelta_na():
+    data = np.array([1, 2, "NaT", 1], dtype="m8[s]")
+    duper = generator.Category.from_data(data=data)
+    duped_values = duper.make(size=1000, with_na=True)
+    assert duped_values.dtype.kind == "m"
+    assert duped_values.isna().any()
+    assert set(duped_values.dropna()) <= set(pd.to_timedelta([1, 2], "s"))
+
+
+def test_CategoryGenerator_stratified():
+    duper = generator.Category(
+        vals=["a", "b", "c"], p=[0.2, 0.3, 0.5], stratified=True
+    )
+    duped_values = duper.make(size=1000)
+    counts = duped_values.value_counts()
+    assert all(abs(counts[["a", "b", "c"]] - [200, 300, 500]) <= 1)
+
+
+def test_CategoryGenerator_from_data_stratified():
+    duper = generator.Category.from_data(
+        np.array(["a"] * 2 + ["b"] * 3 + ["c"] * 5), stratified=True
+    )
+    assert duper.stratified
+    counts = duper.make(size=1000).value_counts()
+    assert all(abs(counts[["a", "b", "c"]] - [200, 300, 500]) <= 1)
+
+
+def test_CategoryGenerator_errors():
+    with pytest.raises(ValueError):
+        generator.Category(vals=["a", "b"], p=[1.0])
+
+    with pytest.raises(ValueError):
+        generator.Category(vals=[], p=[])
+
+    with pytest.raises(ValueError):
+        generator.Category(vals=["a", "b", "c"], p=[0.5, -0.5, 1.0])
+
+    with pytest.raises(ValueError):
+        generator.Category(vals=["a", "b", "c"], p=[0, 0, 0])
+
+
 # Numeric generator
 
 
@@ -106,6 +212,14 @@ def test_NumericGenerator_int():
     assert all(np.isclose(gen.bins, exp_bins))
 
 
+def test_NumericGenerator_seed():
+    dupes = [
+        generator.Numeric(vals=[0.5, 1.0, 2.5], seed=42).make(size=100)
+        for _ in range(2)
+    ]
+    assert all(dupes[0] == dupes[1])
+
+
 def test_NumericGenerator_float():
     data = [0.2, 0.2, 0.2, 0.4, 0.6, 0.8, np.nan]
     gen = generator.Numeric.from_data(data=data)
@@ -144,6 +258,9 @@ def test_NumericGenerator_errors():
     with pytest.raises(TypeError):
         generator.Numeric.from_data(data=np.array(["1", "1"], dtype=np.object_))
 
+    with pytest.raises(TypeError):
+        generator.Numeric.from_data(data=np.array([1, 2], dtype="m8[s]"))
+
     with pytest.raises(ValueError):
         generator.Numeric.from_data(data=np.array([], dtype=np.int_))
 
@@ -175,6 +292,14 @@ def test_DatetimeGenerator_precision(datetime_data):
     assert duper.precision == datetime_data.name
 
 
+def test_DatetimeGenerator_ns_bounds():
+    data = np.datetime64("2022-06-01T12:00:00.000000001") + np.arange(10)
+    duper = generator.Datetime.from_data(data=data, seed=0)
+    duped_values = duper.make(size=10_000)
+    assert duped_values.min() >= data[0]
+    assert duped_values.max() <= data[-1]
+
+
 # Regex generator
 
 
@@ -195,3 +320,38 @@ def test_DatetimeGenerator_precision(datetime_data):
 def test_RegexGenerator_regex(regex_data):
     duper = generator.Regex.from_data(data=regex_data)
     assert duper.regex == r"[a-j][\-][0-9]"
+
+
+@pytest.mark.parametrize(
+    "regex",
+    [
+        r"[a-j][\-][0-9]",
+        r"[A-C][\\][.][xz]",
+        r"[0-9A-F][0-9A-F]",
+        r"(foo|ba)r?",
+        r"[ab]c+",
+    ],
+)
+def test_RegexGenerator_make(regex):
+    duper = generator.Regex(regex=regex)
+    duped_values = duper.make(size=100)
+    assert all(duped_values.map(lambda s: re.fullmatch(regex, s) is not None))
+
+
+def test_RegexGenerator_regex_escaped_hyphen():
+    duper = generator.Regex.from_data(data=np.array(["-", "4", "5", "6", "8"]))
+    assert duper.regex == r"[\-4-68]"
+
+
+def test_RegexGenerator_seed():
+    dupes = [
+        generator.Regex(regex=r"[ab]c+", seed=42).make(size=100)
+        for _ in range(2)
+    ]
+    assert all(dupes[0] == dupes[1])
+
+
+def test_RegexGenerator_empty_strings():
+    duper = generator.Regex.from_data(data=np.array(["", ""], dtype=object))
+    assert duper.regex == ""
+    assert all(duper.make(size=10) == "")